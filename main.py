@@ -7,12 +7,12 @@ Single-file app for the Spella contract; use with SpellCast or headless.
 from __future__ import annotations
 
 import argparse
-import hashlib
-import json
 import os
+import re
 import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # -----------------------------------------------------------------------------
 # Constants (match Spella.sol)
@@ -37,31 +37,71 @@ ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 # Hashing (EVM-style bytes32 from string; use eth_hash for keccak in production)
 # -----------------------------------------------------------------------------
 
-def _hash_bytes(data: bytes) -> bytes:
+def _resolve_keccak() -> Callable[[bytes], bytes]:
+    """Pick the fastest available keccak256: pysha3, then eth_hash, then the sha3 fallback."""
+    try:
+        from sha3 import keccak_256
+
+        def _pysha3_keccak(data: bytes) -> bytes:
+            return keccak_256(data).digest()
+
+        return _pysha3_keccak
+    except ImportError:
+        pass
     try:
         from eth_hash.auto import keccak
-        return keccak(data)
+        keccak(b"")  # eth_hash loads its backend lazily; fail here rather than on first use
+        return keccak
     except ImportError:
-        h = hashlib.sha3_256(data).digest() if hasattr(hashlib, "sha3_256") else hashlib.sha256(data).digest()
-        return h[:32] if len(h) >= 32 else h.ljust(32, b"\x00")
+        pass
+
+    import hashlib
+
+    # Both candidates produce 32-byte digests, so no truncation or padding is needed.
+    sha3 = getattr(hashlib, "sha3_256", hashlib.sha256)
+
+    def _sha3_fallback(data: bytes) -> bytes:
+        return sha3(data).digest()
+
+    return _sha3_fallback
+
+
+# Resolved on first hash so commands that never hash skip the backend imports.
+_KECCAK: Optional[Callable[[bytes], bytes]] = None
+
 
+def _load_keccak() -> Callable[[bytes], bytes]:
+    global _KECCAK
+    if _KECCAK is None:
+        _KECCAK = _resolve_keccak()
+    return _KECCAK
 
+
+@lru_cache(maxsize=4096)
 def title_hash_from_string(s: str) -> bytes:
-    return _hash_bytes(s.encode("utf-8"))
+    return (_KECCAK or _load_keccak())(s.encode("utf-8"))
 
 
-def category_hash_from_string(s: str) -> bytes:
-    return _hash_bytes(s.encode("utf-8"))
+# Titles and categories hash identically; alias them so both share one cache.
+category_hash_from_string = title_hash_from_string
 
 
 def bytes32_to_hex(b: bytes) -> str:
+    if len(b) == 32:
+        return HEX_PREFIX + b.hex()
     if len(b) > 32:
-        b = b[-32:]
-    return HEX_PREFIX + (b.hex() if isinstance(b, bytes) else b).rjust(64, "0")
+        return HEX_PREFIX + b[-32:].hex()
+    return HEX_PREFIX + b.rjust(32, b"\x00").hex()
 
 
 # -----------------------------------------------------------------------------
 # Fee and price calculations
+#
+# Batch paths (batch-fee, run-simulation) are bound by interpreter dispatch, not
+# memory bandwidth: items are short strings and wei ints, so per-item Python calls
+# cost more than the hashing and arithmetic. Wins come from cutting those calls
+# (cached hashes, fee checks hoisted out of loops, one buffered write); native
+# kernels only pay for their load cost on very large library batches.
 # -----------------------------------------------------------------------------
 
 def compute_fee_wei(price_wei: int, fee_bps: int) -> int:
@@ -75,6 +115,76 @@ def compute_seller_receives(price_wei: int, fee_bps: int) -> int:
     return price_wei - fee
 
 
+def make_fee_fn(fee_bps: int) -> Callable[[int], int]:
+    """Return a price -> fee function with fee_bps checked once and bound as a constant."""
+    if fee_bps > SPEL_MAX_FEE_BPS:
+        raise ValueError("fee_bps must be <= %s" % SPEL_MAX_FEE_BPS)
+
+    def fee_for(price_wei: int) -> int:
+        return (price_wei * fee_bps) // SPEL_BPS_BASE
+
+    return fee_for
+
+
+_INT64_MAX = 2 ** 63 - 1
+
+# Largest |price| whose product with any allowed fee_bps still fits in int64.
+_FEE_BATCH_INT64_MAX = _INT64_MAX // SPEL_MAX_FEE_BPS
+
+
+def _fee_batch(prices, fee_bps, out):
+    for i in range(prices.size):
+        out[i] = (prices[i] * fee_bps) // SPEL_BPS_BASE
+    return out
+
+
+# (numpy, jitted _fee_batch) once loaded, False when numba is not installed.
+_FEE_KERNEL: Any = None
+
+
+def _load_fee_kernel() -> Any:
+    global _FEE_KERNEL
+    if _FEE_KERNEL is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:  # numba is optional; batch fees fall back to Python ints
+            _FEE_KERNEL = False
+        else:
+            _FEE_KERNEL = (np, njit(cache=True)(_fee_batch))
+    return _FEE_KERNEL
+
+
+# Once loaded, the kernel beats Python ints from ~64 prices up (about 2x at 1k+). Loading it
+# costs ~0.5s (numba import plus cached kernel), which only pays for itself after ~10M prices.
+_FEE_KERNEL_MIN_LEN = 64
+_FEE_KERNEL_LOAD_MIN_LEN = 10_000_000
+
+
+def compute_fees_batch(prices: List[int], fee_bps: int) -> List[int]:
+    """Fee for each price; large int64-safe batches go through the numba kernel when available.
+
+    The kernel is for library callers only: batch-fee takes its prices from a single
+    argv string, which can never reach _FEE_KERNEL_LOAD_MIN_LEN prices.
+    """
+    if fee_bps > SPEL_MAX_FEE_BPS:
+        raise ValueError("fee_bps must be <= %s" % SPEL_MAX_FEE_BPS)
+    min_len = _FEE_KERNEL_LOAD_MIN_LEN if _FEE_KERNEL is None else _FEE_KERNEL_MIN_LEN
+    if (
+        _FEE_KERNEL is not False
+        and len(prices) >= min_len
+        and -SPEL_MAX_FEE_BPS <= fee_bps
+        and -_FEE_BATCH_INT64_MAX <= min(prices)
+        and max(prices) <= _FEE_BATCH_INT64_MAX
+    ):
+        kernel = _load_fee_kernel()
+        if kernel:
+            np, fee_batch = kernel
+            arr = np.asarray(prices, dtype=np.int64)
+            return fee_batch(arr, fee_bps, np.empty_like(arr)).tolist()
+    return [(p * fee_bps) // SPEL_BPS_BASE for p in prices]
+
+
 # -----------------------------------------------------------------------------
 # Config and state (for CLI)
 # -----------------------------------------------------------------------------
@@ -87,19 +197,65 @@ class WishConfig:
     fee_bps: int = 12
 
 
+# (loads, dumps) for the config file: orjson when installed, else stdlib json. Resolved on first use.
+_CONFIG_CODEC: Optional[Tuple[Callable[[bytes], Any], Callable[[Any], bytes]]] = None
+
+
+def _config_codec() -> Tuple[Callable[[bytes], Any], Callable[[Any], bytes]]:
+    global _CONFIG_CODEC
+    if _CONFIG_CODEC is None:
+        import json
+
+        def _json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj, indent=2).encode("utf-8")
+
+        try:
+            import orjson
+        except ImportError:
+            _CONFIG_CODEC = (json.loads, _json_dumps)
+        else:
+            # orjson only handles 64-bit ints: it rejects larger ones on dump and turns
+            # them into floats on load, so both directions fall back to stdlib json.
+            def _orjson_loads(raw: bytes) -> Any:
+                data = orjson.loads(raw)
+                if isinstance(data, dict) and any(isinstance(v, float) for v in data.values()):
+                    return json.loads(raw)
+                return data
+
+            def _orjson_dumps(obj: Any) -> bytes:
+                try:
+                    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+                except TypeError:
+                    return _json_dumps(obj)
+
+            _CONFIG_CODEC = (_orjson_loads, _orjson_dumps)
+    return _CONFIG_CODEC
+
+
+@lru_cache(maxsize=8)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size are only part of the cache key, so an edited file is re-read.
+    loads, _ = _config_codec()
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
 def load_config(path: Optional[str] = None) -> WishConfig:
     path = path or os.path.join(os.path.dirname(__file__), "wish_config.json")
     cfg = WishConfig()
-    if os.path.isfile(path):
-        try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            cfg.contract_address = data.get("contractAddress", "")
-            cfg.rpc_url = data.get("rpcUrl", "")
-            cfg.chain_id = int(data.get("chainId", 1))
-            cfg.fee_bps = int(data.get("feeBps", 12))
-        except Exception:
-            pass
+    try:
+        st = os.stat(path)
+    except OSError:
+        return cfg
+    try:
+        # A directory, or a file removed since the stat, fails in open() and keeps the defaults.
+        data = _read_config_data(path, st.st_mtime_ns, st.st_size)
+        cfg.contract_address = data.get("contractAddress", "")
+        cfg.rpc_url = data.get("rpcUrl", "")
+        cfg.chain_id = int(data.get("chainId", 1))
+        cfg.fee_bps = int(data.get("feeBps", 12))
+    except Exception:
+        pass
     return cfg
 
 
@@ -111,8 +267,12 @@ def save_config(cfg: WishConfig, path: Optional[str] = None) -> None:
         "chainId": cfg.chain_id,
         "feeBps": cfg.fee_bps,
     }
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    _, dumps = _config_codec()
+    # Serialize before opening: "wb" truncates, and a failed dump must not empty the file.
+    payload = dumps(data)
+    with open(path, "wb") as f:
+        f.write(payload)
+    _read_config_data.cache_clear()
 
 
 # -----------------------------------------------------------------------------
@@ -131,43 +291,67 @@ class SpellEntry:
 
 
 class WishSpellStore:
+    """Spell store laid out as parallel columns; row ``spell_id - 1`` holds one spell."""
+
     def __init__(self) -> None:
-        self._spells: Dict[int, SpellEntry] = {}
         self._counter = 0
-        self._spell_ids: List[int] = []
+        # Columns are preallocated to SPEL_MAX_SPELLS rows; listing a spell fills the next row.
+        self._seller: List[str] = [""] * SPEL_MAX_SPELLS
+        self._title_hash: List[bytes] = [b""] * SPEL_MAX_SPELLS
+        self._category_hash: List[bytes] = [b""] * SPEL_MAX_SPELLS
+        self._price_wei: List[int] = [0] * SPEL_MAX_SPELLS
+        self._listed_at_block: List[int] = [0] * SPEL_MAX_SPELLS
+        # Listed ids in listing order (a dict used as an ordered set).
+        self._listed: Dict[int, None] = {}
+
+    def _check_id(self, spell_id: int) -> None:
+        if not isinstance(spell_id, int) or not 1 <= spell_id <= self._counter:
+            raise ValueError("Spell not found")
 
     def list_spell(self, seller: str, title_hash: bytes, category_hash: bytes, price_wei: int, block: int = 0) -> int:
         if self._counter >= SPEL_MAX_SPELLS:
             raise ValueError("Max spells reached")
-        self._counter += 1
-        spell_id = self._counter
-        self._spells[spell_id] = SpellEntry(
-            spell_id=spell_id,
-            seller=seller,
-            title_hash=title_hash,
-            category_hash=category_hash,
-            price_wei=price_wei,
-            listed_at_block=block,
-            listed=True,
-        )
-        self._spell_ids.append(spell_id)
+        i = self._counter
+        self._counter = spell_id = i + 1
+        self._seller[i] = seller
+        self._title_hash[i] = title_hash
+        self._category_hash[i] = category_hash
+        self._price_wei[i] = price_wei
+        self._listed_at_block[i] = block
+        self._listed[spell_id] = None
         return spell_id
 
     def delist(self, spell_id: int) -> None:
-        if spell_id not in self._spells:
-            raise ValueError("Spell not found")
-        self._spells[spell_id].listed = False
+        self._check_id(spell_id)
+        self._listed.pop(spell_id, None)
 
     def get_spell(self, spell_id: int) -> SpellEntry:
-        if spell_id not in self._spells:
-            raise ValueError("Spell not found")
-        return self._spells[spell_id]
+        """Return a snapshot of the spell; later store updates are not reflected in it."""
+        self._check_id(spell_id)
+        i = spell_id - 1
+        return SpellEntry(
+            spell_id=spell_id,
+            seller=self._seller[i],
+            title_hash=self._title_hash[i],
+            category_hash=self._category_hash[i],
+            price_wei=self._price_wei[i],
+            listed_at_block=self._listed_at_block[i],
+            listed=spell_id in self._listed,
+        )
 
     def get_listed_ids(self) -> List[int]:
-        return [s for s in self._spell_ids if self._spells[s].listed]
+        return list(self._listed)
+
+    def count_listed(self) -> int:
+        return len(self._listed)
+
+    def listed_under(self, max_price_wei: int) -> List[int]:
+        """Listed spell ids priced at or below max_price_wei, in listing order."""
+        prices = self._price_wei
+        return [s for s in self._listed if prices[s - 1] <= max_price_wei]
 
     def get_spell_ids(self) -> List[int]:
-        return list(self._spell_ids)
+        return list(range(1, self._counter + 1))
 
 
 # -----------------------------------------------------------------------------
@@ -275,18 +459,15 @@ def cmd_batch_fee(args: argparse.Namespace) -> int:
     if fee_bps < 0 or fee_bps > SPEL_MAX_FEE_BPS:
         print("Invalid fee_bps", file=sys.stderr)
         return 1
-    total_fee = 0
-    total_to_seller = 0
-    for p in prices:
-        if p < 0:
-            continue
-        f = compute_fee_wei(p, fee_bps)
-        s = compute_seller_receives(p, fee_bps)
-        total_fee += f
-        total_to_seller += s
-        print("Price %s wei -> fee %s, to seller %s" % (p, f, s))
-    print("Total fee: %s wei" % total_fee)
-    print("Total to seller: %s wei" % total_to_seller)
+    prices = [p for p in prices if p >= 0]
+    fees = compute_fees_batch(prices, fee_bps)
+    total_fee = sum(fees)
+    total_to_seller = sum(prices) - total_fee
+    # One write for the whole report instead of a print per price.
+    lines = [f"Price {p} wei -> fee {f}, to seller {p - f}" for p, f in zip(prices, fees)]
+    lines.append(f"Total fee: {total_fee} wei")
+    lines.append(f"Total to seller: {total_to_seller} wei\n")
+    sys.stdout.write("\n".join(lines))
     return 0
 
 
@@ -294,11 +475,12 @@ def cmd_batch_fee(args: argparse.Namespace) -> int:
 # Validate address (simple hex length)
 # -----------------------------------------------------------------------------
 
+# 0x prefix, then 40 hex digits; whitespace around the digits is tolerated as before.
+_ADDRESS_MATCH = re.compile(r"0x\s*[0-9a-fA-F]{40}\s*").fullmatch
+
+
 def is_valid_address(addr: str) -> bool:
-    if not addr or not addr.startswith(HEX_PREFIX):
-        return False
-    raw = addr[2:].strip()
-    return len(raw) == 40 and all(c in "0123456789abcdefABCDEF" for c in raw)
+    return bool(addr and _ADDRESS_MATCH(addr))
 
 
 def cmd_validate_address(args: argparse.Namespace) -> int:
@@ -332,59 +514,110 @@ def cmd_simulate_buy(args: argparse.Namespace) -> int:
 # Main CLI
 # -----------------------------------------------------------------------------
 
+def _add_fee_parser(sub: Any) -> None:
+    p = sub.add_parser("fee", help="Compute fee and seller receives for a price")
+    p.add_argument("price", help="Price in wei")
+    p.add_argument("--fee-bps", default="12", help="Fee in basis points")
+    p.set_defaults(func=cmd_fee)
+
+
+def _add_hash_parser(sub: Any) -> None:
+    p = sub.add_parser("hash", help="Hash a string to bytes32 (title or category)")
+    p.add_argument("string", help="String to hash")
+    p.add_argument("--kind", choices=["title", "category"], default="title")
+    p.set_defaults(func=cmd_hash)
+
+
+def _add_simulate_list_parser(sub: Any) -> None:
+    p = sub.add_parser("simulate-list", help="Simulate listing a spell")
+    p.add_argument("title", help="Spell title string")
+    p.add_argument("category", help="Category string")
+    p.add_argument("price", help="Price in wei")
+    p.add_argument("--seller", default="", help="Seller address")
+    p.set_defaults(func=cmd_simulate_list)
+
+
+def _add_config_parser(sub: Any) -> None:
+    p = sub.add_parser("config", help="Show or set config")
+    p.add_argument("--set-contract", metavar="ADDR", help="Set contract address")
+    p.add_argument("--set-rpc", metavar="URL", help="Set RPC URL")
+    p.set_defaults(func=cmd_config)
+
+
+def _add_constants_parser(sub: Any) -> None:
+    p = sub.add_parser("constants", help="Print Spella constants and addresses")
+    p.set_defaults(func=cmd_constants)
+
+
+def _add_batch_fee_parser(sub: Any) -> None:
+    p = sub.add_parser("batch-fee", help="Compute fees for multiple prices (comma-separated)")
+    p.add_argument("prices", help="Comma-separated prices in wei")
+    p.add_argument("--fee-bps", default="12")
+    p.set_defaults(func=cmd_batch_fee)
+
+
+def _add_validate_address_parser(sub: Any) -> None:
+    p = sub.add_parser("validate-address", help="Validate an Ethereum address")
+    p.add_argument("address", help="0x-prefixed address")
+    p.set_defaults(func=cmd_validate_address)
+
+
+def _add_simulate_buy_parser(sub: Any) -> None:
+    p = sub.add_parser("simulate-buy", help="Simulate buying a spell (list then delist, show fee)")
+    p.add_argument("title", help="Spell title")
+    p.add_argument("category", help="Category")
+    p.add_argument("price", help="Price in wei")
+    p.add_argument("--seller", default="")
+    p.add_argument("--fee-bps", default="12")
+    p.set_defaults(func=cmd_simulate_buy)
+
+
+def _add_run_simulation_parser(sub: Any) -> None:
+    p = sub.add_parser("run-simulation", help="Run multi-list and multi-buy simulation, output JSON")
+    p.add_argument("--num-list", default="5", help="Number of spells to list")
+    p.add_argument("--num-buy", default="3", help="Number to buy")
+    p.add_argument("--base-price", default="1000000", help="Base price wei")
+    p.add_argument("--fee-bps", default="12", help="Fee bps")
+    p.set_defaults(func=cmd_run_simulation)
+
+
+# Subcommand name -> function registering its parser; main() builds only the one requested.
+_SUBCOMMAND_BUILDERS: Dict[str, Callable[[Any], None]] = {
+    "fee": _add_fee_parser,
+    "hash": _add_hash_parser,
+    "simulate-list": _add_simulate_list_parser,
+    "config": _add_config_parser,
+    "constants": _add_constants_parser,
+    "batch-fee": _add_batch_fee_parser,
+    "validate-address": _add_validate_address_parser,
+    "simulate-buy": _add_simulate_buy_parser,
+    "run-simulation": _add_run_simulation_parser,
+}
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """First positional token in argv, skipping the value of the global --config option."""
+    it = iter(argv)
+    for tok in it:
+        if tok == "--config":
+            next(it, None)
+        elif not tok.startswith("-"):
+            return tok
+    return None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Wish — Spella spell-book trading helper")
     parser.add_argument("--config", default="", help="Path to wish_config.json")
     sub = parser.add_subparsers(dest="command", help="Commands")
 
-    p_fee = sub.add_parser("fee", help="Compute fee and seller receives for a price")
-    p_fee.add_argument("price", help="Price in wei")
-    p_fee.add_argument("--fee-bps", default="12", help="Fee in basis points")
-    p_fee.set_defaults(func=cmd_fee)
-
-    p_hash = sub.add_parser("hash", help="Hash a string to bytes32 (title or category)")
-    p_hash.add_argument("string", help="String to hash")
-    p_hash.add_argument("--kind", choices=["title", "category"], default="title")
-    p_hash.set_defaults(func=cmd_hash)
-
-    p_sim = sub.add_parser("simulate-list", help="Simulate listing a spell")
-    p_sim.add_argument("title", help="Spell title string")
-    p_sim.add_argument("category", help="Category string")
-    p_sim.add_argument("price", help="Price in wei")
-    p_sim.add_argument("--seller", default="", help="Seller address")
-    p_sim.set_defaults(func=cmd_simulate_list)
-
-    p_cfg = sub.add_parser("config", help="Show or set config")
-    p_cfg.add_argument("--set-contract", metavar="ADDR", help="Set contract address")
-    p_cfg.add_argument("--set-rpc", metavar="URL", help="Set RPC URL")
-    p_cfg.set_defaults(func=cmd_config)
-
-    p_const = sub.add_parser("constants", help="Print Spella constants and addresses")
-    p_const.set_defaults(func=cmd_constants)
-
-    p_batch = sub.add_parser("batch-fee", help="Compute fees for multiple prices (comma-separated)")
-    p_batch.add_argument("prices", help="Comma-separated prices in wei")
-    p_batch.add_argument("--fee-bps", default="12")
-    p_batch.set_defaults(func=cmd_batch_fee)
-
-    p_val = sub.add_parser("validate-address", help="Validate an Ethereum address")
-    p_val.add_argument("address", help="0x-prefixed address")
-    p_val.set_defaults(func=cmd_validate_address)
-
-    p_buy = sub.add_parser("simulate-buy", help="Simulate buying a spell (list then delist, show fee)")
-    p_buy.add_argument("title", help="Spell title")
-    p_buy.add_argument("category", help="Category")
-    p_buy.add_argument("price", help="Price in wei")
-    p_buy.add_argument("--seller", default="")
-    p_buy.add_argument("--fee-bps", default="12")
-    p_buy.set_defaults(func=cmd_simulate_buy)
-
-    p_simrun = sub.add_parser("run-simulation", help="Run multi-list and multi-buy simulation, output JSON")
-    p_simrun.add_argument("--num-list", default="5", help="Number of spells to list")
-    p_simrun.add_argument("--num-buy", default="3", help="Number to buy")
-    p_simrun.add_argument("--base-price", default="1000000", help="Base price wei")
-    p_simrun.add_argument("--fee-bps", default="12", help="Fee bps")
-    p_simrun.set_defaults(func=cmd_run_simulation)
+    command = _requested_command(sys.argv[1:])
+    if command in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[command](sub)
+    else:
+        # Help, errors and unknown commands need the full command list.
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(sub)
 
     args = parser.parse_args()
     if not args.command:
@@ -466,11 +699,14 @@ def run_simulation(
         price = base_price * (i + 1)
         spell_id = store.list_spell(seller, th, ch, price, block=1000 + i)
         results["listed"].append({"spellId": spell_id, "priceWei": price})
-    listed_ids = store.get_listed_ids()
-    for idx, spell_id in enumerate(listed_ids[:num_buy]):
+    to_buy = store.get_listed_ids()[:num_buy]
+    if to_buy:
+        # Built only when something is bought, so fee_bps is validated no earlier than before.
+        fee_for = make_fee_fn(fee_bps)
+    for idx, spell_id in enumerate(to_buy):
         entry = store.get_spell(spell_id)
-        fee = compute_fee_wei(entry.price_wei, fee_bps)
-        to_seller = compute_seller_receives(entry.price_wei, fee_bps)
+        fee = fee_for(entry.price_wei)
+        to_seller = entry.price_wei - fee
         store.delist(spell_id)
         results["bought"].append({
             "spellId": spell_id,
@@ -484,6 +720,8 @@ def run_simulation(
 
 
 def cmd_run_simulation(args: argparse.Namespace) -> int:
+    import json
+
     num_list = int(args.num_list) if args.num_list else 5
     num_buy = int(args.num_buy) if args.num_buy else 3
     base_price = int(args.base_price) if args.base_price else 1_000_000